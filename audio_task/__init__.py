@@ -0,0 +1,5 @@
+from audio_task.audio_task import (SUPPORTED_FORMATS, AudioDataNotValid,
+                                   compute_spectra, load_audio_files,
+                                   plot_spectogram_hz,
+                                   plot_spectogram_hz_stream,
+                                   plot_spectogram_note_scale)
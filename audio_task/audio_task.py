@@ -1,45 +1,76 @@
 try:
     import sys
     import argparse
+    import io
     import librosa
-    import matplotlib
-    import matplotlib.pyplot as plt
     import os
     import numpy as np
+    import scipy.fft
+    import soundfile as sf
+    from concurrent.futures import ThreadPoolExecutor
+    from functools import partial
+    from multiprocessing import get_context
+    from numba import njit, prange
     from tqdm import tqdm
-    # pip install PyQt5
-    matplotlib.use('qtagg')
 except ImportError as impErr:
     print(f"[Error]: Required packages not installed\n{impErr}")
     sys.exit(1)
 
 
-SUPPORTED_FORMATS = ['aiff',
-                     'au',
-                     'avr',
-                     'caf',
-                     'flac',
-                     'htk',
-                     'svx',
-                     'mat4',
-                     'mat5',
-                     'mpc2k',
-                     'mp3',
-                     'ogg',
-                     'paf',
-                     'pvf',
-                     'raw',
-                     'rf64',
-                     'sd2',
-                     'sds',
-                     'ircam',
-                     'voc',
-                     'w64',
-                     'wav',
-                     'nist',
-                     'wavex',
-                     'wve',
-                     'xi']
+class _ScipyFFTLib:
+    """
+    numpy.fft-compatible shim over scipy.fft with workers=-1, so librosa's
+    STFTs run on pocketfft's thread pool instead of single-threaded numpy.
+    """
+    fft = staticmethod(partial(scipy.fft.fft, workers=-1))
+    ifft = staticmethod(partial(scipy.fft.ifft, workers=-1))
+    rfft = staticmethod(partial(scipy.fft.rfft, workers=-1))
+    irfft = staticmethod(partial(scipy.fft.irfft, workers=-1))
+    hfft = staticmethod(partial(scipy.fft.hfft, workers=-1))
+    ihfft = staticmethod(partial(scipy.fft.ihfft, workers=-1))
+
+
+_fftlib = _ScipyFFTLib
+try:
+    # The plot path always runs n_fft=2048, a fixed-shape workload where
+    # FFTW's cached plans beat unplanned transforms; pyfftw is optional
+    # and the scipy shim stays in place without it.
+    import pyfftw
+    pyfftw.interfaces.cache.enable()
+    pyfftw.interfaces.cache.set_keepalive_time(60)
+    _fftlib = pyfftw.interfaces.numpy_fft
+except ImportError:
+    pass
+
+librosa.set_fftlib(_fftlib)
+
+
+SUPPORTED_FORMATS = frozenset({'aiff',
+                               'au',
+                               'avr',
+                               'caf',
+                               'flac',
+                               'htk',
+                               'svx',
+                               'mat4',
+                               'mat5',
+                               'mpc2k',
+                               'mp3',
+                               'ogg',
+                               'paf',
+                               'pvf',
+                               'raw',
+                               'rf64',
+                               'sd2',
+                               'sds',
+                               'ircam',
+                               'voc',
+                               'w64',
+                               'wav',
+                               'nist',
+                               'wavex',
+                               'wve',
+                               'xi'})
 
 
 class AudioDataNotValid(BaseException):
@@ -49,72 +80,496 @@ class AudioDataNotValid(BaseException):
     pass
 
 
-def load_audio_files(directory: str, file_paths: list[str]) -> list[tuple[np.ndarray, int]]:
+def _lazy_pyplot(save: bool = False):
+    """
+    Imports matplotlib and librosa.display on first use.
+
+    Keeping these imports out of module load means loading-only runs and
+    --help never pay the several hundred milliseconds of matplotlib and
+    display setup; repeat calls hit the import cache.
+
+    Parameters
+    ----------
+    save : bool
+        Select the Agg backend for PNG output instead of the interactive
+        Qt backend.
+
+    Returns
+    -------
+    module
+        The matplotlib.pyplot module with the backend configured.
+    """
+    import matplotlib
+    # pip install PyQt5
+    matplotlib.use('Agg' if save else 'qtagg')
+    import matplotlib.pyplot as plt
+    import librosa.display  # noqa: F401 -- registers librosa.display.specshow
+    return plt
+
+
+def _load_one(full_path: str, target_sr: int | None = None,
+              data: bytes | None = None,
+              use_cache: bool = True,
+              check_exists: bool = True) -> tuple[np.ndarray, int] | None:
+    """
+    Loads a single audio file, returning ``None`` if it cannot be loaded.
+
+    Decodes directly with soundfile to avoid the audioread fallback and
+    keeps the samples in float32, resampling only when target_sr is given
+    and differs from the native sampling rate. Decoded samples are cached
+    next to the source as a ``.npy`` file so reruns memory-map them back
+    instead of decoding again.
+
+    Parameters
+    ----------
+    full_path : str
+        Path of the audio file to load.
+    target_sr : int | None
+        Sampling rate to resample to, or ``None`` to keep the native rate.
+    data : bytes | None
+        Raw file contents already read from disk; when given, decoding
+        happens from memory and the file is not touched again.
+    use_cache : bool
+        Reuse and maintain the on-disk ``.npy`` cache of decoded samples.
+    check_exists : bool
+        Stat the file before decoding. Callers that already confirmed the
+        file via a directory scan pass ``False`` to skip the extra syscall.
+
+    Returns
+    -------
+    tuple[np.ndarray, int] | None
+        Tuple containing array and sampling rate of the loaded audio file,
+        or ``None`` if the file is missing, unsupported or failed to decode.
+    """
+    if check_exists and data is None and not os.path.isfile(full_path):
+        print(f'File {full_path} does not exist. Skipping...')
+        return None
+    file_format = os.path.splitext(full_path)[1][1:]
+    if file_format.lower() not in SUPPORTED_FORMATS:
+        print(f'Unsupported file format for {full_path}. Skipping...')
+        return None
+    cache_base = f"{full_path}.{target_sr or 'native'}.f32"
+    if use_cache:
+        try:
+            if os.path.getmtime(cache_base + '.npy') >= os.path.getmtime(full_path):
+                y = np.load(cache_base + '.npy', mmap_mode='r')
+                sr = int(np.load(cache_base + '.sr.npy'))
+                return (y, sr)
+        except OSError:
+            pass
+    try:
+        source = io.BytesIO(data) if data is not None else full_path
+        y, sr = sf.read(source, dtype='float32', always_2d=False)
+        if y.ndim > 1:
+            y = y.mean(axis=1)
+        if target_sr is not None and sr != target_sr:
+            y = librosa.resample(y, orig_sr=sr, target_sr=target_sr)
+            sr = target_sr
+        if use_cache:
+            try:
+                np.save(cache_base + '.npy', y.astype(np.float32, copy=False))
+                np.save(cache_base + '.sr.npy', np.int64(sr))
+            except OSError as e:
+                print(f'Could not cache {full_path}: {e}')
+        return (y, sr)
+    except Exception as e:
+        print(e)
+        return None
+
+
+def _read_files_uring(full_paths: list[str]) -> dict[str, bytes] | None:
+    """
+    Reads many files in batched io_uring submissions.
+
+    One submit covers a whole batch of reads, amortizing syscall cost and
+    letting the kernel exploit NVMe queue depth on small-file workloads.
+
+    Parameters
+    ----------
+    full_paths : list[str]
+        Paths of the files to read.
+
+    Returns
+    -------
+    dict[str, bytes] | None
+        Mapping of path to raw file contents for every file that could be
+        read, or ``None`` if liburing is unavailable on this platform.
+    """
+    if sys.platform != 'linux':
+        return None
+    try:
+        import liburing
+    except ImportError:
+        print('liburing is not installed. Falling back to sequential reads...')
+        return None
+    buffers = {}
+    depth = min(len(full_paths), 128)
+    ring = liburing.io_uring()
+    try:
+        liburing.io_uring_queue_init(depth, ring, 0)
+        cqe = liburing.io_uring_cqe()
+        for start in range(0, len(full_paths), depth):
+            chunk = full_paths[start:start + depth]
+            pending = []
+            for full_path in chunk:
+                try:
+                    fd = os.open(full_path, os.O_RDONLY)
+                except OSError:
+                    continue
+                buf = bytearray(os.fstat(fd).st_size)
+                iov = liburing.iovec(buf)
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_read(sqe, fd, iov.iov_base,
+                                            iov.iov_len, 0)
+                # user_data must index pending, which skips files whose
+                # open failed, not the uncompacted chunk.
+                sqe.user_data = len(pending)
+                pending.append((fd, full_path, buf))
+            if not pending:
+                continue
+            liburing.io_uring_submit_and_wait(ring, len(pending))
+            for _ in range(len(pending)):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                fd, full_path, buf = pending[cqe.user_data]
+                if cqe.res >= 0:
+                    buffers[full_path] = bytes(buf[:cqe.res])
+                liburing.io_uring_cqe_seen(ring, cqe)
+            for fd, _, _ in pending:
+                os.close(fd)
+    except Exception as e:
+        print(f'io_uring read failed ({e}). Falling back to sequential reads...')
+        return None
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return buffers
+
+
+def _open_stream(full_path: str, block_length: int, n_fft: int = 2048,
+                 hop_length: int = 512) -> tuple | None:
+    """
+    Opens an audio file for block-wise streaming instead of full decode.
+
+    Parameters
+    ----------
+    full_path : str
+        Path of the audio file to stream.
+    block_length : int
+        Number of samples per decoded block. Rounded down to the nearest
+        ``n_fft + k * hop_length`` so STFT frames tile each block exactly
+        and no frames are lost at block boundaries.
+    n_fft : int
+        FFT window size the consumer will use; blocks overlap by
+        ``n_fft - hop_length`` samples so STFT frames tile exactly.
+    hop_length : int
+        Number of samples between successive frames.
+
+    Returns
+    -------
+    tuple | None
+        Tuple ``(blocks, sr, n_frames)`` with a block generator, the
+        sampling rate and the total number of STFT frames, or ``None``
+        if the file is missing or unsupported.
+    """
+    if not os.path.isfile(full_path):
+        print(f'File {full_path} does not exist. Skipping...')
+        return None
+    file_format = os.path.splitext(full_path)[1][1:]
+    if file_format.lower() not in SUPPORTED_FORMATS:
+        print(f'Unsupported file format for {full_path}. Skipping...')
+        return None
+    # Frames only tile a block exactly when its length sits on the frame
+    # grid; otherwise the tail samples of every block are dropped.
+    aligned = n_fft + max(1, (block_length - n_fft) // hop_length) * hop_length
+    if aligned != block_length:
+        print(f'Adjusting block_length from {block_length} to {aligned} '
+              f'to align with the STFT frame grid.')
+        block_length = aligned
+    try:
+        info = sf.info(full_path)
+        n_frames = max(0, 1 + (info.frames - n_fft) // hop_length)
+        blocks = sf.blocks(full_path, blocksize=block_length,
+                           overlap=n_fft - hop_length, dtype='float32',
+                           always_2d=False)
+        return (blocks, info.samplerate, n_frames)
+    except Exception as e:
+        print(e)
+        return None
+
+
+def load_audio_files(directory: str, file_paths: list[str],
+                     target_sr: int | None = None, streaming: bool = False,
+                     block_length: int = 2 ** 18,
+                     use_uring: bool = False,
+                     use_cache: bool = True,
+                     parallel: bool = False) -> list[tuple]:
     """
     Loads audio files from the specified directory.
 
+    Files are decoded concurrently in a thread pool since the decoder
+    releases the GIL, keeping the original order of file_paths.
+
     Parameters
     ----------
     directory : str
         The parent directory with audio files.
     file_paths : list[str]
         List of audio file paths relative to the directory.
+    target_sr : int | None
+        Sampling rate to resample to; ``None`` keeps each file's native rate
+        and skips resampling entirely.
+    streaming : bool
+        Open files for block-wise decoding instead of loading them whole,
+        bounding peak memory by block_length rather than file duration.
+        Streamed entries are ``(blocks, sr, n_frames)`` tuples for
+        plot_spectogram_hz_stream; target_sr is ignored.
+    block_length : int
+        Number of samples per decoded block in streaming mode.
+    use_uring : bool
+        Read all file bytes up front in batched io_uring submissions and
+        decode from memory. Requires Linux and the liburing bindings;
+        silently falls back to per-file reads otherwise.
+    use_cache : bool
+        Memory-map decoded samples from ``.npy`` caches written next to
+        the sources on earlier runs, skipping the decoder entirely.
+    parallel : bool
+        Decode in a forkserver process pool instead of threads. Wins when
+        the decode is CPU-bound with the GIL held, e.g. MP3 through the
+        audioread fallback, where threads would serialize.
 
     Returns
     -------
-    list[tuple[np.ndarray, int]]
-        List of tuples with each tuple containing arrya and sampling rate of the loaded audio file.
-    """
-    loaded_sounds = []
-    for file_path in tqdm(file_paths, desc='Loading Files'):
-        full_path = os.path.join(directory, file_path)
-        if os.path.exists(full_path):
-            file_format = os.path.splitext(full_path)[1][1:]
-            if file_format.lower() in SUPPORTED_FORMATS:
-                try:
-                    y, sr = librosa.load(full_path)
-                    loaded_sounds.append((y, sr))
-                except Exception as e:
-                    print(e)
-            else:
-                print(f'Unsupported file format for {full_path}. Skipping...')
+    list[tuple]
+        List of ``(y, sr)`` tuples, or ``(blocks, sr, n_frames)`` tuples
+        in streaming mode.
+    """
+    if not file_paths:
+        return []
+    # One scandir pass caches stat results for every file in the
+    # directory, replacing a stat syscall per requested path. Paths in
+    # subdirectories miss the map and keep the per-file check.
+    try:
+        entries = {entry.name: entry.path
+                   for entry in os.scandir(directory) if entry.is_file()}
+    except OSError:
+        entries = {}
+    tasks = []
+    for file_path in file_paths:
+        entry_path = entries.get(file_path)
+        if entry_path is not None:
+            tasks.append((entry_path, False))
         else:
-            print(f'File {full_path} does not exist. Skipping...')
-    return loaded_sounds
+            tasks.append((os.path.join(directory, file_path), True))
+    full_paths = [full_path for full_path, _ in tasks]
+    if streaming:
+        streams = (_open_stream(full_path, block_length)
+                   for full_path in full_paths)
+        return [stream for stream in streams if stream is not None]
+    buffers = _read_files_uring(full_paths) if use_uring else None
+    if buffers is None:
+        buffers = {}
+    if parallel:
+        with get_context('forkserver').Pool(os.cpu_count()) as pool:
+            results = pool.starmap(
+                _load_one,
+                [(full_path, target_sr, buffers.get(full_path), use_cache,
+                  check_exists) for full_path, check_exists in tasks])
+    else:
+        with ThreadPoolExecutor(max_workers=min(32, len(full_paths))) as executor:
+            results = list(tqdm(executor.map(
+                lambda t: _load_one(t[0], target_sr, data=buffers.get(t[0]),
+                                    use_cache=use_cache, check_exists=t[1]), tasks),
+                total=len(tasks), desc='Loading Files'))
+    return [result for result in results if result is not None]
 
 
-def plot_spectogram_hz(sound_names: list[str], raw_sounds: list[tuple[np.ndarray, int]]):
+def _pad_batch(raw_sounds: list[tuple[np.ndarray, int]]) -> np.ndarray:
     """
-    Plots spectogram of sounds in Hz scale.
+    Packs variable-length signals into one zero-padded float32 matrix.
+
+    The output is preallocated with np.zeros and filled row by row, which
+    avoids the extra concatenate-copy np.stack would make and keeps peak
+    memory at a single (n_sounds, max_len) allocation.
 
     Parameters
     ----------
-    sound_names : list[str]
-        List of sound names.
     raw_sounds : list[tuple[np.ndarray, int]]
         List of tuples containing raw sound array and its sampling rate.
 
+    Returns
+    -------
+    np.ndarray
+        Batch matrix with shape (n_sounds, max_len), float32.
     """
-    for sound_name, (y, _) in tqdm(zip(sound_names, raw_sounds), desc='Generating Spectogram'):
-        if librosa.util.valid_audio(y):
-            fig, ax = plt.subplots(1, 1, figsize=(6, 4))
-            D = librosa.stft(y)
-            S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
-            img = librosa.display.specshow(
-                S_db, x_axis='time', y_axis='log', ax=ax)
-            fig.colorbar(img, ax=ax, format='%+2.0f dB')
-            ax.set(title=f'Spectrogram of {sound_name}')
-            plt.tight_layout()
-            fig.canvas.manager.set_window_title(
-                f'[Log(Hz) Scale] {sound_name}')
-        else:
-            raise AudioDataNotValid(f"Invalid audio data for {sound_name}")
-    plt.show()
+    max_len = max(len(y) for y, _ in raw_sounds)
+    Y = np.zeros((len(raw_sounds), max_len), dtype=np.float32)
+    for i, (y, _) in enumerate(raw_sounds):
+        Y[i, :len(y)] = y
+    return Y
 
 
-def plot_spectogram_note_scale(sound_names: list[str], raw_sounds: list[tuple[np.ndarray, int]]):
+def _stft_rect(Y: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
     """
-    Plots spectogram of sounds in log scale with pitches marked.
+    Computes a centered STFT with a rectangular window.
+
+    Skipping the window multiply avoids one (n_fft, n_frames) temporary
+    per signal; the spectral leakage it introduces is tolerable for quick
+    visualization.
+
+    Parameters
+    ----------
+    Y : np.ndarray
+        Signal(s) with shape (..., n_samples), float32.
+    n_fft : int
+        FFT window size.
+    hop_length : int
+        Number of samples between successive frames.
+
+    Returns
+    -------
+    np.ndarray
+        Complex STFT with shape (..., 1 + n_fft // 2, n_frames).
+    """
+    pad = [(0, 0)] * (Y.ndim - 1) + [(n_fft // 2, n_fft // 2)]
+    Y = np.pad(Y, pad, mode='reflect')
+    frames = librosa.util.frame(Y, frame_length=n_fft, hop_length=hop_length)
+    return _fftlib.rfft(frames, n=n_fft, axis=-2)
+
+
+def _stft_batch(Y: np.ndarray, n_fft: int, hop_length: int) -> np.ndarray:
+    """
+    Computes a centered Hann-window STFT for a whole batch in one rfft.
+
+    Framing the zero-padded (n_sounds, n_samples) matrix yields a
+    (n_sounds, n_fft, n_frames) array; windowing it materializes one
+    contiguous block and a single rfft over the frame axis covers every
+    sound and frame, amortizing plan setup and Python dispatch. Matches
+    librosa.stft with default window, centering and padding.
+
+    Parameters
+    ----------
+    Y : np.ndarray
+        Batch of signals with shape (n_sounds, n_samples), float32.
+    n_fft : int
+        FFT window size.
+    hop_length : int
+        Number of samples between successive frames.
+
+    Returns
+    -------
+    np.ndarray
+        Complex STFT with shape (n_sounds, 1 + n_fft // 2, n_frames).
+    """
+    pad = [(0, 0)] * (Y.ndim - 1) + [(n_fft // 2, n_fft // 2)]
+    Y = np.pad(Y, pad)
+    frames = librosa.util.frame(Y, frame_length=n_fft, hop_length=hop_length)
+    window = librosa.filters.get_window(
+        'hann', n_fft, fftbins=True).astype(np.float32)
+    return _fftlib.rfft(frames * window[:, np.newaxis], n=n_fft, axis=-2)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _abs_to_db_kernel(D, out, amin, top_db):
+    rows, cols = D.shape
+    peak = amin * amin
+    for i in prange(rows):
+        local = amin * amin
+        for j in range(cols):
+            v = D[i, j]
+            m2 = v.real * v.real + v.imag * v.imag
+            local = max(local, m2)
+        peak = max(peak, local)
+    ref_db = 10.0 * np.log10(peak)
+    for i in prange(rows):
+        for j in range(cols):
+            v = D[i, j]
+            m2 = max(v.real * v.real + v.imag * v.imag, amin * amin)
+            out[i, j] = max(10.0 * np.log10(m2) - ref_db, -top_db)
+
+
+def _amplitude_to_db_max(D: np.ndarray) -> np.ndarray:
+    """
+    Converts an STFT straight to dB relative to its peak.
+
+    Fuses magnitude, log scaling and top_db clipping into one
+    Numba-parallel pass over the buffer, instead of the two allocating
+    passes np.abs + librosa.amplitude_to_db would make. Matches
+    ``librosa.amplitude_to_db(np.abs(D), ref=np.max)``.
+
+    Parameters
+    ----------
+    D : np.ndarray
+        Complex STFT or real magnitudes with shape (n_freqs, n_frames).
+
+    Returns
+    -------
+    np.ndarray
+        dB-scaled magnitudes with the same shape, float32.
+    """
+    out = np.empty(D.shape, dtype=np.float32)
+    _abs_to_db_kernel(D, out, np.float32(1e-5), np.float32(80.0))
+    return out
+
+
+def _spectrogram_batch(Y: np.ndarray, n_fft: int, hop_length: int,
+                       use_gpu: bool = False,
+                       rectangular: bool = False) -> np.ndarray:
+    """
+    Computes STFTs for a batch of equal-length signals.
+
+    CPU paths return the complex STFT untouched so the fused dB kernel
+    makes the only pass over it; the GPU path returns float32 magnitudes,
+    halving the device-to-host transfer. _amplitude_to_db_max accepts
+    either.
+
+    Parameters
+    ----------
+    Y : np.ndarray
+        Batch of signals with shape (n_sounds, n_samples), float32.
+    n_fft : int
+        FFT window size.
+    hop_length : int
+        Number of samples between successive frames.
+    use_gpu : bool
+        Run the STFT on a CUDA device via torch when available. Falls back
+        to the CPU path if torch is not installed or no device is present.
+    rectangular : bool
+        Skip the Hann window and frame + rfft directly, trading some
+        spectral leakage for one less large temporary per signal.
+
+    Returns
+    -------
+    np.ndarray
+        Complex STFT, or float32 magnitudes from the GPU path, with shape
+        (n_sounds, 1 + n_fft // 2, n_frames).
+    """
+    if rectangular:
+        return _stft_rect(Y, n_fft, hop_length)
+    if use_gpu:
+        try:
+            import torch
+            if torch.cuda.is_available():
+                t = torch.from_numpy(Y).cuda()
+                D = torch.stft(t, n_fft=n_fft, hop_length=hop_length,
+                               window=torch.hann_window(n_fft, device=t.device),
+                               return_complex=True)
+                return D.abs().cpu().numpy()
+            print('No CUDA device available. Falling back to CPU STFT...')
+        except ImportError:
+            print('torch is not installed. Falling back to CPU STFT...')
+    return _stft_batch(Y, n_fft, hop_length)
+
+
+def compute_spectra(sound_names: list[str], raw_sounds: list[tuple[np.ndarray, int]],
+                    use_gpu: bool = False,
+                    rectangular: bool = False) -> list[tuple[np.ndarray, int]]:
+    """
+    Computes the dB spectrogram of every sound exactly once.
+
+    Both plot scales render the same STFT, so computing S_db up front and
+    passing it to the plot functions avoids recomputing FFTs between
+    menu choices. Each sound's sampling rate travels with its
+    spectrogram: sounds keep their native rate, which may differ per
+    file, and the plot functions need it to scale the axes.
 
     Parameters
     ----------
@@ -122,23 +577,179 @@ def plot_spectogram_note_scale(sound_names: list[str], raw_sounds: list[tuple[np
         List of sound names.
     raw_sounds : list[tuple[np.ndarray, int]]
         List of tuples containing raw sound array and its sampling rate.
+    use_gpu : bool
+        Compute the STFTs on a CUDA device when torch and a GPU are present.
+    rectangular : bool
+        Use a rectangular window instead of Hann for a faster, slightly
+        leakier spectrogram.
+
+    Returns
+    -------
+    list[tuple[np.ndarray, int]]
+        Per-sound tuples of the dB spectrogram, shape
+        (n_freqs, n_frames) float32, and its sampling rate.
     """
+    if not raw_sounds:
+        return []
+    n_fft = 2048
+    hop_length = n_fft // 4
     for sound_name, (y, _) in zip(sound_names, raw_sounds):
-        if librosa.util.valid_audio(y):
+        if not librosa.util.valid_audio(y):
+            raise AudioDataNotValid(f"Invalid audio data for {sound_name}")
+    # Pad all signals to a common length and run a single batched STFT;
+    # librosa vectorizes the rfft over the leading axis, so N small FFT
+    # calls collapse into one contiguous compute pass.
+    Y = _pad_batch(raw_sounds)
+    D_all = _spectrogram_batch(Y, n_fft, hop_length, use_gpu=use_gpu,
+                               rectangular=rectangular)
+    spectra = []
+    for i, (y, sr) in enumerate(raw_sounds):
+        # Slice off the frames that only cover padding for shorter signals.
+        n_frames = 1 + len(y) // hop_length
+        spectra.append((_amplitude_to_db_max(D_all[i, :, :n_frames]), sr))
+    return spectra
+
+
+def plot_spectogram_hz(sound_names: list[str], spectra: list[tuple[np.ndarray, int]],
+                       save_path: str | None = None):
+    """
+    Plots precomputed spectograms in Hz scale.
+
+    Parameters
+    ----------
+    sound_names : list[str]
+        List of sound names.
+    spectra : list[tuple[np.ndarray, int]]
+        Per-sound ``(S_db, sr)`` pairs as returned by compute_spectra.
+    save_path : str | None
+        Directory to write one PNG per sound into instead of showing
+        interactive windows. Pair with the Agg backend to skip GUI canvas
+        setup entirely.
+
+    """
+    if not spectra:
+        return
+    plt = _lazy_pyplot(save=save_path is not None)
+    if save_path is not None:
+        # Agg figures are cheap; write one PNG per sound and free it.
+        for sound_name, (S_db, sr) in tqdm(zip(sound_names, spectra),
+                                           total=len(spectra), desc='Saving Spectogram'):
             fig, ax = plt.subplots(1, 1, figsize=(6, 4))
-            D = librosa.stft(y)
-            S_db = librosa.amplitude_to_db(np.abs(D), ref=np.max)
             img = librosa.display.specshow(
-                S_db, x_axis='time', y_axis='fft_note', ax=ax)
+                S_db, sr=sr, x_axis='time', y_axis='log', ax=ax)
             fig.colorbar(img, ax=ax, format='%+2.0f dB')
             ax.set(title=f'Spectrogram of {sound_name}')
-            plt.tight_layout()
-            fig.canvas.manager.set_window_title(f'[Note Scale] {sound_name}')
-        else:
-            raise AudioDataNotValid(f"Invalid audio data for {sound_name}")
+            fig.tight_layout()
+            fig.savefig(os.path.join(
+                save_path, f"{sound_name.replace(os.sep, '_')}.png"), dpi=100)
+            plt.close(fig)
+        return
+    # One figure with one axes per sound: the Qt canvas and window setup
+    # is paid once instead of once per spectrogram.
+    fig, axes = plt.subplots(1, len(spectra),
+                             figsize=(6 * len(spectra), 4), squeeze=False)
+    axes = axes[0]
+    # zip truncates to the sounds that actually loaded; sound_names can be
+    # longer when some requested files were skipped.
+    for i, (sound_name, (S_db, sr)) in enumerate(
+            tqdm(zip(sound_names, spectra), total=len(spectra),
+                 desc='Generating Spectogram')):
+        ax = axes[i]
+        img = librosa.display.specshow(
+            S_db, sr=sr, x_axis='time', y_axis='log', ax=ax)
+        fig.colorbar(img, ax=ax, format='%+2.0f dB')
+        ax.set(title=f'Spectrogram of {sound_name}')
+    plt.tight_layout()
+    fig.canvas.manager.set_window_title('[Log(Hz) Scale] Spectrograms')
+    plt.show()
+
+
+def plot_spectogram_hz_stream(sound_names: list[str], streamed_sounds: list[tuple]):
+    """
+    Plots spectograms in Hz scale from block-streamed audio.
+
+    STFT columns are computed block by block into a pre-allocated
+    magnitude buffer, so peak memory stays bounded by the block length
+    plus the spectrogram instead of the full waveform.
+
+    Parameters
+    ----------
+    sound_names : list[str]
+        List of sound names.
+    streamed_sounds : list[tuple]
+        List of ``(blocks, sr, n_frames)`` tuples as returned by
+        ``load_audio_files(..., streaming=True)``.
+    """
+    if not streamed_sounds:
+        return
+    plt = _lazy_pyplot()
+    n_fft = 2048
+    hop_length = n_fft // 4
+    window = librosa.filters.get_window('hann', n_fft,
+                                        fftbins=True).astype(np.float32)
+    fig, axes = plt.subplots(1, len(streamed_sounds),
+                             figsize=(6 * len(streamed_sounds), 4), squeeze=False)
+    axes = axes[0]
+    for i, (sound_name, (blocks, sr, n_frames)) in enumerate(
+            tqdm(zip(sound_names, streamed_sounds), total=len(streamed_sounds),
+                 desc='Generating Spectogram')):
+        S_mag = np.empty((1 + n_fft // 2, n_frames), dtype=np.float32)
+        cursor = 0
+        for block in blocks:
+            if block.ndim > 1:
+                block = block.mean(axis=1)
+            if len(block) < n_fft:
+                break
+            frames = librosa.util.frame(block, frame_length=n_fft,
+                                        hop_length=hop_length)
+            k = frames.shape[-1]
+            np.abs(_fftlib.rfft(frames * window[:, np.newaxis], n=n_fft, axis=-2),
+                   out=S_mag[:, cursor:cursor + k])
+            cursor += k
+        S_db = librosa.amplitude_to_db(S_mag[:, :cursor], ref=np.max)
+        img = librosa.display.specshow(
+            S_db, sr=sr, x_axis='time', y_axis='log', ax=axes[i])
+        fig.colorbar(img, ax=axes[i], format='%+2.0f dB')
+        axes[i].set(title=f'Spectrogram of {sound_name}')
+    plt.tight_layout()
+    fig.canvas.manager.set_window_title('[Log(Hz) Scale] Spectrograms')
     plt.show()
 
 
+def plot_spectogram_note_scale(sound_names: list[str],
+                               spectra: list[tuple[np.ndarray, int]],
+                               save_path: str | None = None):
+    """
+    Plots precomputed spectograms in log scale with pitches marked.
+
+    Parameters
+    ----------
+    sound_names : list[str]
+        List of sound names.
+    spectra : list[tuple[np.ndarray, int]]
+        Per-sound ``(S_db, sr)`` pairs as returned by compute_spectra.
+    save_path : str | None
+        Directory to write one PNG per sound into instead of showing
+        interactive windows.
+    """
+    plt = _lazy_pyplot(save=save_path is not None)
+    for sound_name, (S_db, sr) in zip(sound_names, spectra):
+        fig, ax = plt.subplots(1, 1, figsize=(6, 4))
+        img = librosa.display.specshow(
+            S_db, sr=sr, x_axis='time', y_axis='fft_note', ax=ax)
+        fig.colorbar(img, ax=ax, format='%+2.0f dB')
+        ax.set(title=f'Spectrogram of {sound_name}')
+        plt.tight_layout()
+        if save_path is not None:
+            fig.savefig(os.path.join(
+                save_path, f"{sound_name.replace(os.sep, '_')}.png"), dpi=100)
+            plt.close(fig)
+        else:
+            fig.canvas.manager.set_window_title(f'[Note Scale] {sound_name}')
+    if save_path is None:
+        plt.show()
+
+
 def main():
     # parent_directory = "./audio_data/Actor_01"
     # sound_file_paths = ['03-01-01-01-01-01-01.wav',
@@ -150,15 +761,30 @@ def main():
                         help="The parent directory with audio files.")
     parser.add_argument("sound_file_paths", type=str, nargs='+',
                         help="List of audio file paths relative to the directory.")
+    parser.add_argument("--gpu", action='store_true',
+                        help="Compute spectrograms on a CUDA device if available.")
+    parser.add_argument("--save", type=str, default=None, metavar='OUT_DIR',
+                        help="Save spectrograms as PNGs into this directory "
+                             "instead of opening windows.")
+    parser.add_argument("--no-cache", action='store_true',
+                        help="Do not read or write .npy caches of decoded "
+                             "audio next to the source files.")
     args = parser.parse_args()
 
+    if args.save is not None:
+        os.makedirs(args.save, exist_ok=True)
+
     parent_directory = args.parent_directory
     sound_file_paths = args.sound_file_paths
     sound_names = [f'Sound {i+1}' for i in range(len(sound_file_paths))]
 
     sound_names = [f'Sound {i}' for i in sound_file_paths]
 
-    loaded_sounds = load_audio_files(parent_directory, sound_file_paths)
+    loaded_sounds = load_audio_files(parent_directory, sound_file_paths,
+                                     use_cache=not args.no_cache)
+    # Both menu choices render the same STFT; compute S_db once and only
+    # pick the y-axis scale per choice.
+    spectra = compute_spectra(sound_names, loaded_sounds, use_gpu=args.gpu)
 
     while True:
         print("\nChoose an option:")
@@ -168,9 +794,11 @@ def main():
         choice = input("Enter your choice (1/2/3): ")
         match choice:
             case '1':
-                plot_spectogram_hz(sound_names, loaded_sounds)
+                plot_spectogram_hz(sound_names, spectra,
+                                   save_path=args.save)
             case '2':
-                plot_spectogram_note_scale(sound_names, loaded_sounds)
+                plot_spectogram_note_scale(sound_names, spectra,
+                                           save_path=args.save)
             case '3':
                 print('Exiting the program')
                 break